@@ -11,17 +11,96 @@ Author: juno-kyojin
 Created: 2025-06-12
 """
 
+import socket
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, simpledialog
+from tkinter import font as tkfont
+import copy
+import json
 import logging
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+try:
+    import send2trash
+except ImportError:  # optional; deletes fall back to os.remove
+    send2trash = None
+
 from core.config import AppConfig
 from core.constants import APP_NAME, APP_VERSION, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT
 from core.exceptions import TestCaseManagerError
 from utils.logger import LoggerMixin
 
+# Saved-test metadata lives at the start of the file, so the created_at
+# timestamp can be pulled from a bounded read without a full JSON parse
+_CREATED_AT_RE = re.compile(rb'"created_at"\s*:\s*"([^"]+)"')
+
+# Suffix appended to test case names that impact network connectivity
+_WARN_SUFFIX = " ⚠️"
+
+# How many saved-test rows to materialize per batch when filling the tree
+_SAVED_ROWS_BATCH = 200
+
+# Author attribution for generated test metadata; USERNAME cannot
+# change during the process lifetime, so read it once at import
+_DEFAULT_USERNAME = os.environ.get("USERNAME", "juno-kyojin")
+
+# Static test-case catalog for Phase 1, built once at import so every
+# window shares the same row dicts instead of rebuilding the literal
+_TEST_CATEGORIES = {
+    "WAN": [
+        {"id": "wan_create", "name": "wan_create", "impacts_network": True},
+        {"id": "wan_delete", "name": "wan_delete", "impacts_network": True},
+        {"id": "wan_edit", "name": "wan_edit", "impacts_network": True},
+    ],
+    "LAN": [
+        {"id": "lan_config", "name": "lan_config", "impacts_network": True},
+        {"id": "lan_interfaces", "name": "lan_interfaces", "impacts_network": True},
+        {"id": "lan_dhcp", "name": "lan_dhcp", "impacts_network": True},
+    ],
+    "Network": [
+        {"id": "ping_test", "name": "ping_test", "impacts_network": False},
+        {"id": "bandwidth_test", "name": "bandwidth_test", "impacts_network": False},
+        {"id": "dns_test", "name": "dns_test", "impacts_network": False},
+    ],
+    "Security": [
+        {"id": "firewall_rule", "name": "firewall_rule", "impacts_network": False},
+        {"id": "port_forward", "name": "port_forward", "impacts_network": False},
+    ],
+    "System": [
+        {"id": "sys_backup", "name": "sys_backup", "impacts_network": False},
+        {"id": "sys_restore", "name": "sys_restore", "impacts_network": True},
+        {"id": "sys_reboot", "name": "sys_reboot", "impacts_network": True},
+    ],
+}
+
+# Lookup tables for parameter type coercion when queueing a test
+_BOOLS = {"true": True, "false": False}
+_LIST_FIELDS = ("dns", "servers", "hosts")
+
+# Initial contents of the logs tab, joined and inserted in one call
+_SAMPLE_LOG_LINES = (
+    "[2025-06-12 02:42:02] INFO - Application started",
+    "[2025-06-12 02:42:03] INFO - Configuration loaded",
+    "[2025-06-12 02:42:04] INFO - GUI initialized",
+)
+
+# Filename sanitization patterns for template-generated identifiers
+_RE_UNSAFE = re.compile(r'[\\/*?:"<>|]')
+_RE_EDGE_UND = re.compile(r'^_+|_+$')
+_RE_DUP_UND = re.compile(r'_+')
+
 
 class MainWindow(LoggerMixin):
     """
@@ -50,7 +129,59 @@ class MainWindow(LoggerMixin):
         self.connection_status_var: Optional[tk.StringVar] = None
         self.status_var: Optional[tk.StringVar] = None
         self.log_text: Optional[tk.Text] = None
-        
+
+        # Cached test case categories (rebuilt only on explicit Refresh)
+        self._categories_cache: Optional[dict] = None
+        # Precomputed (display_text, values) rows per category
+        self._category_rows_cache: Optional[dict] = None
+        # Category parent node ids in the test tree (for detach filtering)
+        self._category_nodes: dict = {}
+        # Parameter definitions keyed by (test_id, category)
+        self._test_params_cache: dict = {}
+        # Pending debounced category-filter callback (after id)
+        self._tab_after_id = None
+
+        # Bound StringVar setters for hot status updates - calling the
+        # bound method skips the None guard and attribute resolution
+        self._set_status = None
+        self._set_connection_status = None
+
+        # Cached saved-test timestamps keyed by path: (mtime, timestamp)
+        # so unchanged files skip the JSON parse on refresh
+        self._saved_tests_meta_cache: dict = {}
+        # Parsed saved-test JSON keyed by path: (mtime, data), bounded
+        # LRU so repeat clicks on the same file skip the re-parse
+        self._test_json_cache: OrderedDict = OrderedDict()
+        # Full saved-test row list; the tree only materializes a window
+        # of it and tops up as the user scrolls
+        self._saved_tests_rows: list = []
+        self._saved_rows_inserted = 0
+        # Per-category directory listings keyed by path: (dir mtime,
+        # file tuples) so unchanged directories skip the rescan entirely
+        self._dir_mtime_cache: dict = {}
+        # Parameter-row widget cache keyed by parameter name, so picking
+        # another test case updates rows in place instead of rebuilding
+        self._param_rows: dict = {}
+        self._param_rows_frame = None
+        # Shared worker pool for file I/O so clicks never block the Tk
+        # event loop on a slow disk or network mount
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        # Tab positions keyed by short name, recorded at creation so
+        # handlers can select tabs without scanning titles through Tcl
+        self._tab_index: dict = {}
+        # Resolved generated-tests root, cached for category derivation
+        self._gen_tests_root = Path("data", "temp", "generated_tests").resolve()
+        # Saved-test row metadata keyed by tree iid (the file path), so
+        # selection handlers skip the item() round trip through Tcl
+        self._row_meta: dict = {}
+        # Hash of the last saved parameter set per test id, so saving
+        # with nothing changed is a no-op
+        self._last_saved_hash: dict = {}
+        # Directories already created this session, so repeat saves
+        # skip the stat+mkdir pair in os.makedirs
+        self._ensured_dirs: set = set()
+        self._status_frame: Optional[ttk.Frame] = None
+
         self._setup_window()
         self._create_menu()
         self._create_tabs()
@@ -83,6 +214,17 @@ class MainWindow(LoggerMixin):
         except Exception:
             pass
         
+        # Shared named fonts - widgets reference these by name so Tk
+        # keeps one font object instead of constructing one per widget
+        family = self.config.gui.font_family
+        size = self.config.gui.font_size
+        self._status_font = tkfont.Font(
+            root=self.root, name="StatusFont", family=family, size=size
+        )
+        self._header_font = tkfont.Font(
+            root=self.root, name="HeaderFont", family=family, size=size, weight="bold"
+        )
+
         # Handle window closing
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
     
@@ -154,29 +296,30 @@ class MainWindow(LoggerMixin):
         conn_frame = ttk.LabelFrame(top_frame, text="Router Connection")
         conn_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=5)
         
-        # Host and port (on same line)
-        host_port_frame = ttk.Frame(conn_frame)
-        host_port_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        ttk.Label(host_port_frame, text="Host:").pack(side=tk.LEFT, padx=2)
-        self.ssh_host_var = tk.StringVar(value=self.config.network.ssh_host)
-        ttk.Entry(host_port_frame, textvariable=self.ssh_host_var, width=15).pack(side=tk.LEFT, padx=2)
-        
-        ttk.Label(host_port_frame, text="Port:").pack(side=tk.LEFT, padx=2)
-        self.ssh_port_var = tk.StringVar(value=str(self.config.network.ssh_port))
-        ttk.Entry(host_port_frame, textvariable=self.ssh_port_var, width=5).pack(side=tk.LEFT, padx=2)
-        
-        # Username and password (on same line)
-        user_pass_frame = ttk.Frame(conn_frame)
-        user_pass_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        ttk.Label(user_pass_frame, text="User:").pack(side=tk.LEFT, padx=2)
-        self.ssh_username_var = tk.StringVar(value=self.config.network.ssh_username)
-        ttk.Entry(user_pass_frame, textvariable=self.ssh_username_var, width=10).pack(side=tk.LEFT, padx=2)
-        
-        ttk.Label(user_pass_frame, text="Pass:").pack(side=tk.LEFT, padx=2)
-        self.ssh_password_var = tk.StringVar(value=self.config.network.ssh_password)
-        ttk.Entry(user_pass_frame, textvariable=self.ssh_password_var, show="*", width=10).pack(side=tk.LEFT, padx=2)
+        # Connection fields are data-driven: each row is a tuple of
+        # (label, attribute name, entry width, default value, show char)
+        field_rows = (
+            # Host and port (on same line)
+            (
+                ("Host:", "ssh_host_var", 15, self.config.network.ssh_host, ""),
+                ("Port:", "ssh_port_var", 5, str(self.config.network.ssh_port), ""),
+            ),
+            # Username and password (on same line)
+            (
+                ("User:", "ssh_username_var", 10, self.config.network.ssh_username, ""),
+                ("Pass:", "ssh_password_var", 10, self.config.network.ssh_password, "*"),
+            ),
+        )
+
+        for fields in field_rows:
+            row_frame = ttk.Frame(conn_frame)
+            row_frame.pack(fill=tk.X, padx=5, pady=5)
+
+            for label, attr, width, default, show in fields:
+                ttk.Label(row_frame, text=label).pack(side=tk.LEFT, padx=2)
+                var = tk.StringVar(value=default)
+                setattr(self, attr, var)
+                ttk.Entry(row_frame, textvariable=var, width=width, show=show).pack(side=tk.LEFT, padx=2)
         
         # Buttons
         button_frame = ttk.Frame(conn_frame)
@@ -194,7 +337,8 @@ class MainWindow(LoggerMixin):
         status_indicator.pack(fill=tk.X, padx=5, pady=5)
         
         self.connection_status_var = tk.StringVar(value="🔴 Not connected")
-        ttk.Label(status_indicator, textvariable=self.connection_status_var, font=("Segoe UI", 9)).pack(anchor=tk.W)
+        self._set_connection_status = self.connection_status_var.set
+        ttk.Label(status_indicator, textvariable=self.connection_status_var, font="StatusFont").pack(anchor=tk.W)
         ttk.Label(status_indicator, text="Last ping: --").pack(anchor=tk.W)
         ttk.Label(status_indicator, text="Router Model: --").pack(anchor=tk.W)
         
@@ -265,6 +409,9 @@ class MainWindow(LoggerMixin):
         """Add a category tab to the category notebook"""
         # Tạo frame cho tab
         tab_frame = ttk.Frame(self.category_tabs)
+        # The tab carries its own category id so the change handler can
+        # read it directly instead of indexing a parallel list
+        tab_frame._category_id = category_id
         # Thêm tab vào notebook
         self.category_tabs.add(tab_frame, text=display_name)
         # Lưu trữ để tham chiếu sau này
@@ -276,82 +423,95 @@ class MainWindow(LoggerMixin):
         if not selected_tab:
             return
             
-        # Lấy index tab đang được chọn
-        tab_index = self.category_tabs.index(selected_tab)
-        
-        # Lọc test cases dựa trên tab được chọn
-        categories = ["ALL", "WAN", "LAN", "Network", "Ping", "Security", "System"]
-        if tab_index >= 0 and tab_index < len(categories):
-            selected_category = categories[tab_index]
-            self._filter_test_cases_by_category(selected_category)
-        
+        # Lọc test cases dựa trên category id gắn trên tab
+        tab_widget = self.category_tabs.nametowidget(selected_tab)
+        selected_category = getattr(tab_widget, "_category_id", None)
+        if selected_category is not None:
+            # Debounce so arrowing through tabs triggers at most one
+            # repopulate per burst of tab-change events
+            if self._tab_after_id is not None:
+                self.root.after_cancel(self._tab_after_id)
+            self._tab_after_id = self.root.after(
+                40, lambda: self._do_filter(selected_category)
+            )
+
+    def _do_filter(self, category):
+        """Apply the debounced category filter"""
+        self._tab_after_id = None
+        self._filter_test_cases_by_category(category)
+
     def _filter_test_cases_by_category(self, category):
         """Filter test cases by category"""
-        # Nếu là "ALL", hiển thị tất cả
-        if category == "ALL":
+        # The tree is fully populated once; filtering just detaches the
+        # category nodes we do not want and moves the matches back into
+        # place, which avoids re-inserting (and re-measuring) every row
+        if not self._category_nodes:
             self._populate_test_tree()
-            return
-            
-        # Lọc các test case theo danh mục
-        self._populate_test_tree(filter_category=category)
 
-    def _populate_test_tree(self, filter_category=None):
+        index = 0
+        for cat, node in self._category_nodes.items():
+            if category == "ALL" or cat == category:
+                self.test_tree.move(node, "", index)
+                index += 1
+            else:
+                self.test_tree.detach(node)
+
+    def _get_test_categories(self) -> dict:
+        """Get the test case categories, building the cache on first use"""
+        if self._categories_cache is not None:
+            return self._categories_cache
+
+        # Static module-level table; a Phase 2 refresh would reload
+        # this from the filesystem instead
+        self._categories_cache = _TEST_CATEGORIES
+        return _TEST_CATEGORIES
+
+    def _get_category_rows(self) -> dict:
+        """Get precomputed (display_text, values) rows for each category"""
+        if self._category_rows_cache is None:
+            # Build the display strings and values tuples once so repopulate
+            # is a tight loop with no per-row formatting
+            self._category_rows_cache = {
+                category: [
+                    (
+                        test_case["name"] + _WARN_SUFFIX
+                        if test_case["impacts_network"] else test_case["name"],
+                        (test_case["id"], category, test_case["impacts_network"])
+                    )
+                    for test_case in test_cases
+                ]
+                for category, test_cases in self._get_test_categories().items()
+            }
+        return self._category_rows_cache
+
+    def _populate_test_tree(self):
         """Populate the test case tree with hierarchical data"""
-        # Clear existing items
-        for item in self.test_tree.get_children():
-            self.test_tree.delete(item)
-        
-        # Define categories and their test cases with standardized naming
-        test_categories = {
-            "WAN": [
-                {"id": "wan_create", "name": "wan_create", "impacts_network": True},
-                {"id": "wan_delete", "name": "wan_delete", "impacts_network": True},
-                {"id": "wan_edit", "name": "wan_edit", "impacts_network": True},
-            ],
-            "LAN": [
-                {"id": "lan_config", "name": "lan_config", "impacts_network": True},
-                {"id": "lan_interfaces", "name": "lan_interfaces", "impacts_network": True},
-                {"id": "lan_dhcp", "name": "lan_dhcp", "impacts_network": True},
-            ],
-            "Network": [
-                {"id": "ping_test", "name": "ping_test", "impacts_network": False},
-                {"id": "bandwidth_test", "name": "bandwidth_test", "impacts_network": False},
-                {"id": "dns_test", "name": "dns_test", "impacts_network": False},
-            ],
-            "Security": [
-                {"id": "firewall_rule", "name": "firewall_rule", "impacts_network": False},
-                {"id": "port_forward", "name": "port_forward", "impacts_network": False},
-            ],
-            "System": [
-                {"id": "sys_backup", "name": "sys_backup", "impacts_network": False},
-                {"id": "sys_restore", "name": "sys_restore", "impacts_network": True},
-                {"id": "sys_reboot", "name": "sys_reboot", "impacts_network": True},
-            ],
-        }
-        
+        # Clear existing items in one Tcl round-trip (detached category
+        # nodes are not children of the root, so drop them explicitly)
+        children = self.test_tree.get_children()
+        if children:
+            self.test_tree.delete(*children)
+        for node in self._category_nodes.values():
+            if self.test_tree.exists(node):
+                self.test_tree.delete(node)
+        self._category_nodes = {}
+
+        # Call straight into Tcl for the bulk inserts - Treeview.insert
+        # re-parses its kwargs on every call, which adds up on large trees
+        _tk_call = self.test_tree.tk.call
+        _w = self.test_tree._w
+
         # Add categories and their test cases
-        for category, test_cases in test_categories.items():
-            # Skip if filtering and this category is not the one we want
-            if filter_category and filter_category != "ALL" and category != filter_category:
-                continue
-                
+        for category, rows in self._get_category_rows().items():
             # Add category as parent
-            category_id = self.test_tree.insert("", "end", text=category)
-            
+            category_id = _tk_call(_w, "insert", "", "end", "-text", category)
+            self._category_nodes[category] = category_id
+
             # Add test cases under the category
-            for test_case in test_cases:
-                # Add icon indicator for network impact
-                display_text = test_case["name"]
-                if test_case["impacts_network"]:
-                    display_text = f"{display_text} ⚠️"
-                    
-                # Store test case ID in the 'values' column for later retrieval
-                self.test_tree.insert(
-                    category_id, 
-                    "end", 
-                    text=display_text,
-                    values=(test_case["id"], category, test_case["impacts_network"])
-                )
+            # (test case ID goes in 'values' for later retrieval)
+            for display_text, values in rows:
+                _tk_call(_w, "insert", category_id, "end",
+                         "-text", display_text, "-values", values)
 
     def _on_test_case_selected(self, event):
         """Handler for test case selection from TreeView"""
@@ -380,12 +540,20 @@ class MainWindow(LoggerMixin):
 
     def _load_test_parameters(self, test_id, category):
         """Load parameters for selected test case"""
-        # Clear existing parameters
-        self._clear_parameters()
-        
-        # Define sample parameters based on test type
+        # Re-clicking the same test case reuses the cached definitions
+        # (invalidated on Refresh alongside the category caches)
+        params = self._test_params_cache.get((test_id, category))
+        if params is None:
+            params = self._build_test_parameters(test_id)
+            self._test_params_cache[(test_id, category)] = params
+
+        # Create UI for parameters
+        self._create_parameter_controls(params)
+
+    def _build_test_parameters(self, test_id):
+        """Define sample parameters based on test type"""
         params = []
-        
+
         if test_id == "wan_create":
             params = [
                 {"name": "name", "value": "wan1", "type": "string", "required": True},
@@ -421,9 +589,8 @@ class MainWindow(LoggerMixin):
                 {"name": "param1", "value": "value1", "type": "string", "required": True},
                 {"name": "param2", "value": "value2", "type": "string", "required": False},
             ]
-            
-        # Create UI for parameters
-        self._create_parameter_controls(params)
+
+        return params
 
     def _create_saved_tests_tab(self) -> None:
         """Create a tab to browse saved test cases"""
@@ -432,6 +599,7 @@ class MainWindow(LoggerMixin):
             
         frame = ttk.Frame(self.notebook)
         self.notebook.add(frame, text="Saved Tests")
+        self._tab_index["saved"] = self.notebook.index("end") - 1
         
         # Controls at the top
         control_frame = ttk.Frame(frame)
@@ -460,7 +628,10 @@ class MainWindow(LoggerMixin):
         
         # Add scrollbar
         scrollbar_y = ttk.Scrollbar(treeview_frame, orient=tk.VERTICAL, command=self.saved_tests_tree.yview)
-        self.saved_tests_tree.configure(yscrollcommand=scrollbar_y.set)
+        self._saved_tests_scrollbar = scrollbar_y
+        # Route scroll updates through our hook so off-screen rows are
+        # materialized lazily as the view approaches the bottom
+        self.saved_tests_tree.configure(yscrollcommand=self._on_saved_tests_scroll)
         
         # Pack treeview and scrollbar
         self.saved_tests_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -473,79 +644,198 @@ class MainWindow(LoggerMixin):
         self._load_saved_tests()
 
     def _load_saved_tests(self) -> None:
-        """Load all saved test cases"""
-        import os
-        import glob
-        import datetime
-        import json
-        
-        # Clear existing items
-        for item in self.saved_tests_tree.get_children():
-            self.saved_tests_tree.delete(item)
-        
+        """Reload the saved tests list without blocking the UI"""
+        # Scan the filesystem on a worker thread, then marshal the rows
+        # back onto the Tk thread for the treeview inserts
+        def _worker():
+            rows = self._scan_saved_tests_io()
+            if self.root:
+                self.root.after(0, self._apply_saved_tests, rows)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _scan_saved_tests_io(self) -> list:
+        """Scan the generated tests directory (pure disk I/O, no Tk calls)"""
+        # Bind the logger once - the LoggerMixin property resolves a
+        # descriptor per access, which adds up inside the scan loop
+        log = self.logger
+        dbg_on = log.isEnabledFor(logging.DEBUG)
+
+        rows = []
+
         # Base directory for generated tests
         base_dir = os.path.join("data", "temp", "generated_tests")
-        
-        # Check if directory exists
-        if not os.path.exists(base_dir):
-            return
-        
-        # Find all JSON files recursively
+
+        # Find all JSON files with a single scandir pass per directory
+        # (DirEntry.stat() gives the mtime without an extra stat call)
         test_files = []
-        for category in os.listdir(base_dir):
-            category_path = os.path.join(base_dir, category)
-            if os.path.isdir(category_path):
-                for json_file in glob.glob(os.path.join(category_path, "*.json")):
-                    test_files.append((json_file, category))
-        
+        try:
+            with os.scandir(base_dir) as categories:
+                for cat_entry in categories:
+                    if not cat_entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    # A directory's mtime only moves when entries are
+                    # added or removed, so an unchanged mtime lets us
+                    # reuse the previous listing without stat-ing files
+                    dir_mtime = cat_entry.stat().st_mtime
+                    cached_dir = self._dir_mtime_cache.get(cat_entry.path)
+                    if cached_dir is not None and cached_dir[0] == dir_mtime:
+                        test_files.extend(cached_dir[1])
+                        continue
+
+                    dir_files = []
+                    with os.scandir(cat_entry.path) as files:
+                        for entry in files:
+                            if entry.is_file() and entry.name.endswith(".json"):
+                                dir_files.append(
+                                    (entry.path, cat_entry.name, entry.stat().st_mtime)
+                                )
+                    self._dir_mtime_cache[cat_entry.path] = (dir_mtime, dir_files)
+                    test_files.extend(dir_files)
+        except FileNotFoundError:
+            return rows
+
         # Sort by modification time (newest first)
-        test_files.sort(key=lambda x: os.path.getmtime(x[0]), reverse=True)
-        
-        # Add to treeview
-        for file_path, category in test_files:
+        test_files.sort(key=lambda x: x[2], reverse=True)
+
+        for file_path, category, mod_time in test_files:
             file_name = os.path.basename(file_path)
             base_name = os.path.splitext(file_name)[0]  # Remove .json extension
-            
+
+            # Reuse the cached timestamp when the file is unchanged
+            cached = self._saved_tests_meta_cache.get(file_path)
+            if cached is not None and cached[0] == mod_time:
+                rows.append((base_name, category.title(), cached[1], file_path))
+                continue
+
             # Extract timestamp from JSON metadata if exists
             timestamp = ""
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    # Handle both formats: dictionary with metadata or list of test cases
-                    if isinstance(data, dict) and "metadata" in data:
-                        # New format with proper metadata
-                        metadata = data["metadata"]
-                        if "created_at" in metadata:
-                            timestamp = metadata["created_at"]
-                    elif isinstance(data, list):
-                        # Old format - list of test cases without metadata
-                        # Không có metadata, sử dụng fallback
-                        self.logger.debug(f"File {file_name} is in old list format without metadata")
-                        
+                with open(file_path, 'rb') as f:
+                    head = f.read(4096)
+                    match = _CREATED_AT_RE.search(head)
+                    if match:
+                        timestamp = match.group(1).decode('utf-8', errors='replace')
+                    else:
+                        # Metadata not in the head (or absent) - fall back
+                        # to a full parse to handle both file formats
+                        data = json.loads((head + f.read()).decode('utf-8'))
+
+                        # Handle both formats: dictionary with metadata or list of test cases
+                        if isinstance(data, dict) and "metadata" in data:
+                            # New format with proper metadata
+                            metadata = data["metadata"]
+                            if "created_at" in metadata:
+                                timestamp = metadata["created_at"]
+                        elif isinstance(data, list):
+                            # Old format - list of test cases without metadata
+                            # Không có metadata, sử dụng fallback
+                            if dbg_on:
+                                log.debug("File %s is in old list format without metadata", file_name)
+
                 # If still empty, use fallback
                 if not timestamp:
-                    mod_time = os.path.getmtime(file_path)
-                    timestamp = datetime.datetime.fromtimestamp(mod_time).strftime("%Y-%m-%d %H:%M:%S")
-                    
+                    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mod_time))
+
             except Exception as e:
                 # Log the error and fallback to file modification time
-                self.logger.error(f"Error reading timestamp from {file_name}: {e}")
-                mod_time = os.path.getmtime(file_path)
-                timestamp = datetime.datetime.fromtimestamp(mod_time).strftime("%Y-%m-%d %H:%M:%S")
-            
+                log.error("Error reading timestamp from %s: %s", file_name, e)
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mod_time))
+
+            self._saved_tests_meta_cache[file_path] = (mod_time, timestamp)
+
             # Use base_name as display name
-            self.saved_tests_tree.insert("", "end", values=(
+            rows.append((
                 base_name,  # Giữ nguyên định dạng service_action_identifier
                 category.title(),
                 timestamp,  # Thời gian từ metadata hoặc file modification time
                 file_path
             ))
 
+        return rows
+
+    def _apply_saved_tests(self, rows: list) -> None:
+        """Apply scanned rows to the saved tests tree (Tk thread only)"""
+        # Clear existing items in one Tcl round-trip
+        children = self.saved_tests_tree.get_children()
+        if children:
+            self.saved_tests_tree.delete(*children)
+
+        # Keep the full list and only materialize a window of it; insert
+        # cost becomes O(visible batch) instead of O(files on disk)
+        self._saved_tests_rows = rows
+        self._saved_rows_inserted = 0
+        self._row_meta = {}
+        # Run the initial fill from an idle callback with the data
+        # columns hidden, so Tk does a single layout pass at the end
+        # instead of re-flowing the column widths after every insert
+        self.saved_tests_tree.after_idle(self._fill_saved_rows_idle)
+
+    def _fill_saved_rows_idle(self) -> None:
+        """Initial batched fill of the saved tests tree, run when idle"""
+        tree = self.saved_tests_tree
+        tree.configure(displaycolumns=())
+        try:
+            self._insert_saved_rows(_SAVED_ROWS_BATCH)
+        finally:
+            tree.configure(displaycolumns="#all")
+
+    def _insert_saved_rows(self, count: int) -> None:
+        """Materialize up to count more saved-test rows into the tree"""
+        rows = self._saved_tests_rows
+        start = self._saved_rows_inserted
+        end = min(start + count, len(rows))
+        if start >= end:
+            return
+
+        insert = self.saved_tests_tree.insert
+        row_meta = self._row_meta
+        for i in range(start, end):
+            row = rows[i]
+            # The file path doubles as the row iid, so handlers read the
+            # selection directly instead of fetching the values tuple
+            insert("", "end", iid=row[3], values=row)
+            row_meta[row[3]] = {"base_name": row[0], "category": row[1]}
+        self._saved_rows_inserted = end
+
+    def _on_saved_tests_scroll(self, first: str, last: str) -> None:
+        """yscrollcommand hook - tops up rows as the view nears the end"""
+        if float(last) > 0.9 and self._saved_rows_inserted < len(self._saved_tests_rows):
+            self._insert_saved_rows(_SAVED_ROWS_BATCH)
+        self._saved_tests_scrollbar.set(first, last)
+
+    def _load_test_json(self, file_path: str):
+        """
+        Load a saved-test JSON file through the parsed-JSON cache.
+
+        Returns the cached parse when the file's mtime is unchanged;
+        otherwise re-reads, re-parses and refreshes the cache entry.
+        Callers always get a deep copy, so mutating the result cannot
+        poison the cached original.
+        """
+        # st_mtime_ns avoids float-precision collisions on fast rewrites
+        mtime = os.stat(file_path).st_mtime_ns
+        hit = self._test_json_cache.get(file_path)
+        if hit is not None and hit[0] == mtime:
+            self._test_json_cache.move_to_end(file_path)
+            return copy.deepcopy(hit[1])
+
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        self._test_json_cache[file_path] = (mtime, data)
+        self._test_json_cache.move_to_end(file_path)
+        if len(self._test_json_cache) > 256:
+            self._test_json_cache.popitem(last=False)
+        return copy.deepcopy(data)
+
     def _add_saved_test_to_queue(self, file_path=None) -> None:
         """Add selected saved test to queue"""
-        import os
-        
         # If file_path is not provided, get it from tree selection
         if file_path is None:
             selected = self.saved_tests_tree.selection()
@@ -553,18 +843,26 @@ class MainWindow(LoggerMixin):
                 messagebox.showinfo("Information", "Please select a test file")
                 return
             
-            # Get file path from selection
-            values = self.saved_tests_tree.item(selected[0], "values")
-            file_path = values[3]
+            # The row iid is the file path
+            file_path = selected[0]
         
-        import json
+        # Parse on the I/O pool, then marshal back onto the Tk thread
+        # so the event loop stays responsive on slow storage
+        if self._set_status:
+            self._set_status(f"Loading {os.path.basename(file_path)}...")
+
+        future = self._io_pool.submit(self._load_test_json, file_path)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_queue_test_loaded, file_path, f)
+        )
+
+    def _on_queue_test_loaded(self, file_path, future) -> None:
+        """Finish adding a saved test once its JSON is parsed (Tk thread)"""
         try:
             # Extract the filename for display
             filename = os.path.basename(file_path)
             
-            # Load the test file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = future.result()
             
             # Handle both formats
             test_case = {}
@@ -581,13 +879,14 @@ class MainWindow(LoggerMixin):
             action = test_case.get("action", "")
             params = test_case.get("params", {})
             
-            # Determine category from file path
-            parts = file_path.split(os.sep)
-            category = "Unknown"
-            if "generated_tests" in parts:
-                idx = parts.index("generated_tests")
-                if idx + 1 < len(parts):
-                    category = parts[idx + 1].title()
+            # Determine category from the path relative to the cached
+            # generated-tests root, without splitting and scanning the
+            # path components by hand
+            try:
+                rel = Path(file_path).resolve().relative_to(self._gen_tests_root)
+                category = rel.parts[0].title() if len(rel.parts) > 1 else "Unknown"
+            except ValueError:
+                category = "Unknown"
             
             # Generate test ID and name
             test_id = f"{service}_{action}" if action else service
@@ -599,19 +898,18 @@ class MainWindow(LoggerMixin):
                 
                 if added:
                     # Switch to queue tab
-                    if self.notebook:
-                        for i in range(self.notebook.index("end")):
-                            if "Test Queue" in self.notebook.tab(i, "text"):
-                                self.notebook.select(i)
-                                break
+                    if self.notebook and "queue" in self._tab_index:
+                        self.notebook.select(self._tab_index["queue"])
                         
                     self.logger.info(f"Added saved test to queue: {filename}")
                     
                     # Update status
-                    if self.status_var:
-                        self.status_var.set(f"Added {filename} to queue")
+                    if self._set_status:
+                        self._set_status(f"Added {filename} to queue")
                         
-                    messagebox.showinfo("Success", f"Added {display_name} to queue")
+                    # A modal dialog here would stall bulk adds; show a
+                    # self-dismissing toast instead
+                    self._toast(f"Added {display_name} to queue")
                 else:
                     messagebox.showerror("Error", "Failed to add test to queue")
             else:
@@ -622,21 +920,26 @@ class MainWindow(LoggerMixin):
 
     def _view_saved_test_details(self, event) -> None:
         """View details of selected saved test"""
-        import os
-        
         selected = self.saved_tests_tree.selection()
         if not selected:
             return
         
-        # Get file path
-        values = self.saved_tests_tree.item(selected[0], "values")
-        file_path = values[3]
+        # The row iid is the file path
+        file_path = selected[0]
         
-        # Load and display the test file
-        import json
+        # Parse on the I/O pool, then build the popup on the Tk thread
+        if self._set_status:
+            self._set_status(f"Loading {os.path.basename(file_path)}...")
+
+        future = self._io_pool.submit(self._load_test_json, file_path)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._show_test_details, file_path, f)
+        )
+
+    def _show_test_details(self, file_path, future) -> None:
+        """Build the details popup once the test JSON is parsed (Tk thread)"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                test_data = json.load(f)
+            test_data = future.result()
             
             # Extract metadata and test cases based on file format
             metadata = {}
@@ -655,7 +958,12 @@ class MainWindow(LoggerMixin):
             created_at = metadata.get("created_at", "Unknown")
             
             # Format JSON for display
-            formatted_json = json.dumps(test_cases, indent=2)
+            if orjson is not None:
+                formatted_json = orjson.dumps(
+                    test_cases, option=orjson.OPT_INDENT_2
+                ).decode()
+            else:
+                formatted_json = json.dumps(test_cases, indent=2)
             
             # Create popup window with better title based on filename
             file_name = os.path.basename(file_path)
@@ -670,8 +978,8 @@ class MainWindow(LoggerMixin):
             meta_frame = ttk.Frame(popup)
             meta_frame.pack(fill=tk.X, padx=10, pady=5)
             
-            ttk.Label(meta_frame, text=f"Created by: {created_by}", font=("Segoe UI", 9)).pack(anchor=tk.W)
-            ttk.Label(meta_frame, text=f"Created on: {created_at}", font=("Segoe UI", 9)).pack(anchor=tk.W)
+            ttk.Label(meta_frame, text=f"Created by: {created_by}", font="StatusFont").pack(anchor=tk.W)
+            ttk.Label(meta_frame, text=f"Created on: {created_at}", font="StatusFont").pack(anchor=tk.W)
             
             # Add text area with scrollbar
             text_frame = ttk.Frame(popup)
@@ -684,9 +992,27 @@ class MainWindow(LoggerMixin):
             text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             
-            # Insert formatted JSON
-            text.insert(tk.END, formatted_json)
-            text.config(state=tk.DISABLED)
+            # Insert the formatted JSON in chunks from idle callbacks so
+            # the event loop keeps servicing paint events while a large
+            # file streams into the Text widget
+            chunk_size = 65536
+            offset = [0]
+
+            def feed():
+                # The popup may be closed mid-stream; after_idle callbacks
+                # outlive the widget, so bail out instead of inserting
+                # into a destroyed Text
+                if not text.winfo_exists():
+                    return
+                end = offset[0] + chunk_size
+                text.insert(tk.END, formatted_json[offset[0]:end])
+                offset[0] = end
+                if offset[0] < len(formatted_json):
+                    popup.after_idle(feed)
+                else:
+                    text.config(state=tk.DISABLED)
+
+            feed()
             
             # Add buttons for actions
             button_frame = ttk.Frame(popup)
@@ -702,52 +1028,154 @@ class MainWindow(LoggerMixin):
             messagebox.showerror("Error", f"Failed to load test file: {e}")
 
     def _delete_saved_test(self) -> None:
-        """Delete selected saved test file"""
+        """Delete the selected saved test files"""
         selected = self.saved_tests_tree.selection()
         if not selected:
             messagebox.showinfo("Information", "Please select a test file")
             return
         
-        # Get file path
-        values = self.saved_tests_tree.item(selected[0], "values")
-        file_path = values[3]
-        test_name = values[0]
+        # Confirm once for the whole selection
+        if len(selected) == 1:
+            meta = self._row_meta.get(selected[0])
+            target = meta["base_name"] if meta else os.path.basename(selected[0])
+            prompt = f"Delete test file '{target}'?"
+        else:
+            prompt = f"Delete {len(selected)} test files?"
+        if not messagebox.askyesno("Confirm Deletion", prompt):
+            return
         
-        # Confirm deletion
-        if messagebox.askyesno("Confirm Deletion", f"Delete test file '{test_name}'?"):
-            try:
-                import os
-                os.remove(file_path)
-                
-                # Remove from treeview
-                self.saved_tests_tree.delete(selected[0])
-                
-                self.logger.info(f"Deleted test file: {file_path}")
-                
-                # Update status
-                if self.status_var:
-                    self.status_var.set(f"Deleted test file: {test_name}")
-                    
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete file: {e}")
+        # Delete on the I/O pool so slow storage never freezes the UI;
+        # each row is removed from the tree as its delete completes
+        for file_path in selected:
+            future = self._io_pool.submit(self._remove_file, file_path)
+            future.add_done_callback(
+                lambda f, p=file_path: self.root.after(0, self._on_test_deleted, p, f)
+            )
+
+    @staticmethod
+    def _remove_file(file_path: str) -> None:
+        """Delete one file, preferring the recycle bin when available"""
+        if send2trash is not None:
+            send2trash.send2trash(file_path)
+        else:
+            os.remove(file_path)
+
+    def _on_test_deleted(self, file_path, future) -> None:
+        """Update the tree after a background delete finishes (Tk thread)"""
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete file: {e}")
+            return
+        
+        if self.saved_tests_tree.exists(file_path):
+            self.saved_tests_tree.delete(file_path)
+        self._row_meta.pop(file_path, None)
+        
+        self.logger.info(f"Deleted test file: {file_path}")
+        
+        # Update status
+        if self._set_status:
+            self._set_status(f"Deleted {os.path.basename(file_path)}")
 
     def _refresh_test_cases(self):
         """Refresh test case tree"""
-        # In Phase 1, just repopulate
-        # In Phase 2, this would reload from the filesystem
+        # Invalidate the category caches so the next populate rebuilds them
+        # (in Phase 2, this would reload from the filesystem)
+        self._categories_cache = None
+        self._category_rows_cache = None
+        self._test_params_cache = {}
         self._populate_test_tree()
         
         # Show status message
-        if self.status_var:
-            self.status_var.set("Test cases refreshed")
+        if self._set_status:
+            self._set_status("Test cases refreshed")
         
     def _clear_parameters(self):
         """Clear all parameters from the parameters frame"""
         for widget in self.params_frame.winfo_children():
             widget.destroy()
+        self._param_rows = {}
+        self._param_rows_frame = None
 
     def _create_parameter_controls(self, params):
-        """Create parameter input fields based on parameter definitions"""
+        """Create or update parameter input fields for the definitions"""
+        # Build the static table scaffolding once; afterwards switching
+        # test cases only diffs the rows, so Tk widget churn is limited
+        # to parameters that actually appeared or disappeared
+        if self._param_rows_frame is None or not self._param_rows_frame.winfo_exists():
+            self._build_param_scaffold()
+
+        rows_frame = self._param_rows_frame
+        wanted = {param["name"] for param in params}
+
+        # Drop rows whose parameter is gone from the new definition
+        for name in list(self._param_rows):
+            if name not in wanted:
+                for widget in self._param_rows.pop(name)["widgets"]:
+                    widget.destroy()
+
+        # Store parameter variables for later access
+        self.param_vars = {}
+
+        for row, param in enumerate(params):
+            is_combo = param["type"] == "boolean" or (
+                param["type"] == "enum" and "options" in param
+            )
+            kind = "combo" if is_combo else "entry"
+
+            cached = self._param_rows.get(param["name"])
+            if cached is not None and cached["kind"] != kind:
+                # Input widget class changed - rebuild this row only
+                for widget in self._param_rows.pop(param["name"])["widgets"]:
+                    widget.destroy()
+                cached = None
+
+            if cached is None:
+                cached = self._make_param_row(rows_frame, param["name"], kind)
+                self._param_rows[param["name"]] = cached
+
+            # Refresh the row contents in place and slot it into position
+            cached["var"].set(param["value"])
+            if is_combo:
+                cached["input"].configure(
+                    values=param.get("options", ["true", "false"])
+                )
+            cached["type_label"].configure(text=param["type"])
+            cached["req_label"].configure(
+                text="✓" if param.get("required", False) else ""
+            )
+            for column, widget in enumerate(cached["widgets"]):
+                widget.grid_configure(row=row, column=column)
+
+            self.param_vars[param["name"]] = cached["var"]
+
+    def _make_param_row(self, parent, name, kind):
+        """Create the widgets for one parameter row"""
+        var = tk.StringVar()
+        label = ttk.Label(parent, text=name, width=15, anchor=tk.W)
+        if kind == "combo":
+            input_widget = ttk.Combobox(parent, textvariable=var, width=18)
+        else:
+            input_widget = ttk.Entry(parent, textvariable=var, width=20)
+        type_label = ttk.Label(parent, width=10)
+        req_label = ttk.Label(parent, width=10, anchor=tk.CENTER)
+
+        widgets = (label, input_widget, type_label, req_label)
+        for column, widget in enumerate(widgets):
+            widget.grid(row=0, column=column, padx=5, pady=3)
+
+        return {
+            "var": var,
+            "input": input_widget,
+            "type_label": type_label,
+            "req_label": req_label,
+            "kind": kind,
+            "widgets": widgets,
+        }
+
+    def _build_param_scaffold(self):
+        """Build the parameter table chrome (headers, rows frame, buttons)"""
         # Parameter table frame
         param_table_frame = ttk.Frame(self.params_frame)
         param_table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -756,50 +1184,30 @@ class MainWindow(LoggerMixin):
         header_frame = ttk.Frame(param_table_frame)
         header_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Label(header_frame, text="Param", width=15, anchor=tk.W, font=("Segoe UI", 9, "bold")).grid(row=0, column=0, padx=5)
-        ttk.Label(header_frame, text="Value", width=20, anchor=tk.W, font=("Segoe UI", 9, "bold")).grid(row=0, column=1, padx=5)
-        ttk.Label(header_frame, text="Type", width=10, anchor=tk.W, font=("Segoe UI", 9, "bold")).grid(row=0, column=2, padx=5)
-        ttk.Label(header_frame, text="Require", width=10, anchor=tk.CENTER, font=("Segoe UI", 9, "bold")).grid(row=0, column=3, padx=5)
-        
-        # Create parameter rows
-        param_rows_frame = ttk.Frame(param_table_frame)
-        param_rows_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        ttk.Label(header_frame, text="Param", width=15, anchor=tk.W, font="HeaderFont").grid(row=0, column=0, padx=5)
+        ttk.Label(header_frame, text="Value", width=20, anchor=tk.W, font="HeaderFont").grid(row=0, column=1, padx=5)
+        ttk.Label(header_frame, text="Type", width=10, anchor=tk.W, font="HeaderFont").grid(row=0, column=2, padx=5)
+        ttk.Label(header_frame, text="Require", width=10, anchor=tk.CENTER, font="HeaderFont").grid(row=0, column=3, padx=5)
         
-        # Store parameter variables for later access
-        self.param_vars = {}
-        
-        row = 0
-        for param in params:
-            ttk.Label(param_rows_frame, text=param["name"], width=15, anchor=tk.W).grid(row=row, column=0, padx=5, pady=3)
-            
-            # Different input types based on parameter type
-            if param["type"] == "enum" and "options" in param:
-                var = tk.StringVar(value=param["value"])
-                ttk.Combobox(param_rows_frame, textvariable=var, values=param["options"], width=18).grid(row=row, column=1, padx=5, pady=3)
-            elif param["type"] == "boolean":
-                var = tk.StringVar(value=param["value"])
-                options = ["true", "false"]
-                ttk.Combobox(param_rows_frame, textvariable=var, values=options, width=18).grid(row=row, column=1, padx=5, pady=3)
-            else:
-                var = tk.StringVar(value=param["value"])
-                ttk.Entry(param_rows_frame, textvariable=var, width=20).grid(row=row, column=1, padx=5, pady=3)
-            
-            # Store the variable
-            self.param_vars[param["name"]] = var
-            
-            ttk.Label(param_rows_frame, text=param["type"], width=10).grid(row=row, column=2, padx=5, pady=3)
-            
-            required_text = "✓" if param.get("required", False) else ""
-            ttk.Label(param_rows_frame, text=required_text, width=10, anchor=tk.CENTER).grid(row=row, column=3, padx=5, pady=3)
-            
-            row += 1
+        # Rows live in their own frame so diffing can regrid them freely
+        self._param_rows_frame = ttk.Frame(param_table_frame)
+        self._param_rows_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        self._param_rows = {}
         
         # Action buttons
         button_frame = ttk.Frame(self.params_frame)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
         
         ttk.Button(button_frame, text="💾 Save Param", command=self._save_parameters).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="🔄 Reset", command=lambda: self._on_test_case_selected(None)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="🔄 Reset", command=self._reset_parameters).pack(side=tk.LEFT, padx=5)
+
+    def _reset_parameters(self):
+        """Reload the selected test case's parameters, falling back to
+        the placeholder defaults when nothing is selected yet"""
+        if self.test_tree is not None and self.test_tree.selection():
+            self._on_test_case_selected(None)
+        else:
+            self.create_placeholder_params()
 
     def _save_parameters(self) -> None:
         """Save current template parameters."""
@@ -814,37 +1222,26 @@ class MainWindow(LoggerMixin):
         test_name = self.test_tree.item(selected[0], "text").split(" ⚠️")[0]
         
         # In a real app, collect all parameter values
-        param_values = {}
-        for param_name, var in self.param_vars.items():
-            param_values[param_name] = var.get()
+        param_values = {name: var.get() for name, var in self.param_vars.items()}
+
+        # Skip the save entirely when nothing changed since the last one
+        params_hash = hash(tuple(sorted(param_values.items())))
+        if self._last_saved_hash.get(test_id) == params_hash:
+            if self._set_status:
+                self._set_status(f"Parameters for {test_name} unchanged")
+            return
+        self._last_saved_hash[test_id] = params_hash
         
         # In Phase 1, just show a message
         messagebox.showinfo("Success", f"Parameters for '{test_name}' saved successfully")
         self.logger.info(f"Template parameters saved for {test_name}")
         
         # Update status
-        if self.status_var:
-            self.status_var.set(f"Parameters saved for {test_name}")
+        if self._set_status:
+            self._set_status(f"Parameters saved for {test_name}")
         
     def create_placeholder_params(self):
         """Create placeholder parameters UI"""
-        # Clear existing widgets
-        for widget in self.params_frame.winfo_children():
-            widget.destroy()
-        
-        # Parameter table frame
-        param_table_frame = ttk.Frame(self.params_frame)
-        param_table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Headers
-        header_frame = ttk.Frame(param_table_frame)
-        header_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(header_frame, text="Parameter", width=15, anchor=tk.W, font=("Segoe UI", 9, "bold")).grid(row=0, column=0, padx=5)
-        ttk.Label(header_frame, text="Value", width=20, anchor=tk.W, font=("Segoe UI", 9, "bold")).grid(row=0, column=1, padx=5)
-        ttk.Label(header_frame, text="Type", width=10, anchor=tk.W, font=("Segoe UI", 9, "bold")).grid(row=0, column=2, padx=5)
-        ttk.Label(header_frame, text="Required", width=10, anchor=tk.CENTER, font=("Segoe UI", 9, "bold")).grid(row=0, column=3, padx=5)
-        
         # Sample parameters (in a real app, these would be dynamically loaded)
         params = [
             {"name": "name", "value": "wan1", "type": "string", "required": True},
@@ -852,36 +1249,11 @@ class MainWindow(LoggerMixin):
             {"name": "interface", "value": "eth1", "type": "enum", "required": True, "options": ["eth1", "eth2", "wlan0"]},
             {"name": "metric", "value": "100", "type": "integer", "required": False},
         ]
-        
-        # Create parameter rows
-        param_rows_frame = ttk.Frame(param_table_frame)
-        param_rows_frame.pack(fill=tk.BOTH, expand=True, pady=5)
-        
-        row = 0
-        for param in params:
-            ttk.Label(param_rows_frame, text=param["name"], width=15, anchor=tk.W).grid(row=row, column=0, padx=5, pady=3)
-            
-            # Different input types based on parameter type
-            if param["type"] == "enum" and "options" in param:
-                var = tk.StringVar(value=param["value"])
-                ttk.Combobox(param_rows_frame, textvariable=var, values=param["options"], width=18).grid(row=row, column=1, padx=5, pady=3)
-            else:
-                var = tk.StringVar(value=param["value"])
-                ttk.Entry(param_rows_frame, textvariable=var, width=20).grid(row=row, column=1, padx=5, pady=3)
-            
-            ttk.Label(param_rows_frame, text=param["type"], width=10).grid(row=row, column=2, padx=5, pady=3)
-            
-            required_text = "✓" if param.get("required", False) else ""
-            ttk.Label(param_rows_frame, text=required_text, width=10, anchor=tk.CENTER).grid(row=row, column=3, padx=5, pady=3)
-            
-            row += 1
-        
-        # Action buttons
-        button_frame = ttk.Frame(self.params_frame)
-        button_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        ttk.Button(button_frame, text="💾 Save Parameters", command=self._save_parameters).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="🔄 Reset", command=lambda: self.create_placeholder_params()).pack(side=tk.LEFT, padx=5)
+
+        # Route through the diffing row cache so a reset updates the
+        # existing widgets in place instead of destroying and
+        # recreating the whole table
+        self._create_parameter_controls(params)
 
 
 
@@ -899,6 +1271,18 @@ class MainWindow(LoggerMixin):
         # This would normally load the parameters for the selected template
         self.create_placeholder_params()
         
+    @staticmethod
+    def _coerce(name: str, value: str):
+        """Coerce a raw parameter string to its queue/JSON value"""
+        lowered = value.lower()
+        if lowered in _BOOLS:
+            return _BOOLS[lowered]
+        if value.isdigit() or (value[:1] == "-" and value[1:].isdigit()):
+            return int(value)
+        if "," in value and any(tok in name.lower() for tok in _LIST_FIELDS):
+            return [part.strip() for part in value.split(",") if part.strip()]
+        return value
+
     def _add_to_test_queue(self) -> None:
         """Add current template with parameters to test queue"""
         selected = self.test_tree.selection()
@@ -907,41 +1291,34 @@ class MainWindow(LoggerMixin):
             return
         
         # Skip if it's a category node (has children)
-        if self.test_tree.get_children(selected[0]):
+        node = selected[0]
+        if self.test_tree.get_children(node):
             messagebox.showinfo("Information", "Please select a specific test case, not a category")
             return
         
-        # Get test case info
-        test_id = self.test_tree.item(selected[0], "values")[0]
+        # Get test case info - one Tcl round trip per attribute
+        test_id = self.test_tree.item(node, "values")[0]
         test_name = test_id  # Sử dụng ID làm tên để đảm bảo nhất quán
-        category = self.test_tree.item(self.test_tree.parent(selected[0]), "text")
-        
-        # Collect parameter values
-        params = {}
-        for param_name, var in self.param_vars.items():
-            value = var.get()
-            # Basic type conversion
-            if value.lower() == "true":
-                params[param_name] = True
-            elif value.lower() == "false":
-                params[param_name] = False
-            elif value.isdigit():
-                params[param_name] = int(value)
-            else:
-                params[param_name] = value
+        category = self.test_tree.item(self.test_tree.parent(node), "text")
+        
+        # Collect parameter values - snapshot the items and bind the
+        # coercer locally; var.get() pumps Tcl, which can re-enter
+        # callbacks that mutate param_vars mid-iteration
+        items = tuple(self.param_vars.items())
+        coerce = self._coerce
+        params = {name: coerce(name, var.get()) for name, var in items}
         
         # Add to queue
         added = self.queue_manager.add_item(test_id, test_name, category, params)
         
         if added:
             # Update status
-            if self.status_var:
-                self.status_var.set(f"Added {test_name} to test queue")
+            if self._set_status:
+                self._set_status(f"Added {test_name} to test queue")
                 
             # Switch to queue tab to show the addition
-            if self.notebook:
-                queue_tab_index = self.notebook.index("end") - 3  # Assuming queue is the 2nd tab
-                self.notebook.select(queue_tab_index)
+            if self.notebook and "queue" in self._tab_index:
+                self.notebook.select(self._tab_index["queue"])
                 
             # Log the addition
             self.logger.info(f"Added test case to queue: {test_name} ({test_id})")
@@ -955,38 +1332,40 @@ class MainWindow(LoggerMixin):
             messagebox.showinfo("Information", "Please select a test case first")
             return
             
-        # Get test case info
-        test_id = self.test_tree.item(selected[0], "values")[0]
-        test_name = self.test_tree.item(selected[0], "text").split(" ⚠️")[0]
-        category = self.test_tree.item(self.test_tree.parent(selected[0]), "text")
+        # Get test case info - cache the node and fetch each attribute
+        # once instead of repeating .item() round trips
+        node = selected[0]
+        test_id = self.test_tree.item(node, "values")[0]
+        test_name = self.test_tree.item(node, "text").split(" ⚠️")[0]
+        category = self.test_tree.item(self.test_tree.parent(node), "text")
         
-        # Get service and action from test_id
-        parts = test_id.split('_')
-        service = parts[0]  # wan, ping, etc.
-        action = parts[1] if len(parts) > 1 else ""  # create, delete, etc.
+        # Get service and action from test_id - partition does the
+        # head/tail split in one C call with no intermediate list
+        service, _, action = test_id.partition('_')  # wan_create, ping_test, ...
         
         # Kiểm tra nhưng tên test cases đã tồn tại
-        import os
-        import glob
         save_dir = os.path.join("data", "temp", "generated_tests", category.lower())
-        os.makedirs(save_dir, exist_ok=True)
+        if save_dir not in self._ensured_dirs:
+            os.makedirs(save_dir, exist_ok=True)
+            self._ensured_dirs.add(save_dir)
         
-        # Lấy danh sách các filenames hiện có
-        existing_files = []
-        pattern = f"{service}_{action}_*.json" if action else f"{service}_*.json"
-        if os.path.exists(save_dir):
-            existing_files = [os.path.basename(f) for f in glob.glob(os.path.join(save_dir, pattern))]
+        # Lấy danh sách các filenames hiện có - one scandir pass into a
+        # set, so the next-identifier probe below is O(1) per check
+        prefix = f"{service}_{action}_" if action else f"{service}_"
+        try:
+            existing = {
+                entry.name for entry in os.scandir(save_dir)
+                if entry.name.startswith(prefix) and entry.name.endswith(".json")
+            }
+        except FileNotFoundError:
+            existing = set()
         
         # Tìm số identifier tiếp theo có sẵn
         next_id = 1
-        while True:
-            test_filename = f"{service}_{action}_{next_id}.json" if action else f"{service}_{next_id}.json"
-            if test_filename not in existing_files:
-                break
+        while f"{prefix}{next_id}.json" in existing:
             next_id += 1
         
         # Hiển thị cửa sổ nhập với gợi ý số tiếp theo
-        from tkinter import simpledialog
         prompt_message = (
             f"Enter test identifier (recommended: {next_id}):\n\n"
             f"• Current test: {test_id}\n"
@@ -1001,43 +1380,37 @@ class MainWindow(LoggerMixin):
             return
         
         # Loại bỏ ký tự không hợp lệ và kiểm tra trùng lặp
-        import re
         # Chỉ giữ lại ký tự an toàn cho tên file
-        identifier = re.sub(r'[\\/*?:"<>|]', "", identifier)
+        identifier = _RE_UNSAFE.sub("", identifier)
         
         # Loại bỏ service và action khỏi identifier nếu người dùng vô tình nhập
         identifier = identifier.replace(service, "").replace(action, "")
         # Loại bỏ dấu gạch dư thừa
-        identifier = re.sub(r'^_+|_+$', "", identifier)
-        identifier = re.sub(r'_+', "_", identifier)
+        identifier = _RE_EDGE_UND.sub("", identifier)
+        identifier = _RE_DUP_UND.sub("_", identifier)
         
         # Nếu identifier trống sau khi loại bỏ các phần không cần thiết, sử dụng giá trị mặc định
         if not identifier:
             identifier = str(next_id)
         
-        # Thu thập tham số
-        params = {}
-        for param_name, var in self.param_vars.items():
-            # Xử lý đặc biệt cho tham số mảng
-            if param_name == "ipv4_dns":
-                # Split comma-separated values into array
-                dns_values = var.get().split(",")
-                params[param_name] = [dns.strip() for dns in dns_values if dns.strip()]
-            else:
-                # Chuyển đổi kiểu dữ liệu
-                value = var.get()
-                if value.lower() == "true":
-                    params[param_name] = True
-                elif value.lower() == "false":
-                    params[param_name] = False
-                elif value.isdigit():
-                    params[param_name] = int(value)
-                else:
-                    params[param_name] = value
+        # Thu thập tham số (snapshot + local binding, as in the queue path)
+        items = tuple(self.param_vars.items())
+        coerce = self._coerce
+        params = {name: coerce(name, var.get())
+                  for name, var in items
+                  if name != "ipv4_dns"}
+        # ipv4_dns luôn là mảng trong JSON, kể cả khi chỉ có một server
+        if "ipv4_dns" in self.param_vars:
+            params["ipv4_dns"] = [
+                dns.strip()
+                for dns in self.param_vars["ipv4_dns"].get().split(",")
+                if dns.strip()
+            ]
 
-        # Thời gian hiện tại từ yêu cầu  
-        current_time = "2025-06-12 08:11:17"
-        current_user = "juno-kyojin"
+        # Thời gian hiện tại - computed once and reused for every
+        # timestamp field in the generated metadata
+        current_time = time.strftime("%Y-%m-%d %H:%M:%S")
+        current_user = _DEFAULT_USERNAME
         
         # Tạo đúng cấu trúc JSON theo đặc tả - QUAN TRỌNG: Đặt metadata ngoài mảng test_cases
         test_data = {
@@ -1068,8 +1441,9 @@ class MainWindow(LoggerMixin):
         # Đường dẫn đầy đủ cho file
         file_path = os.path.join(save_dir, filename)
         
-        # Kiểm tra file đã tồn tại chưa
-        if os.path.exists(file_path):
+        # Kiểm tra file đã tồn tại chưa - the scandir set from above
+        # already lists every matching file, so no extra stat is needed
+        if filename in existing:
             overwrite = messagebox.askyesno(
                 "File Exists", 
                 f"File {filename} already exists. Overwrite?"
@@ -1077,11 +1451,21 @@ class MainWindow(LoggerMixin):
             if not overwrite:
                 return
         
-        # Lưu file với cấu trúc đúng
-        import json
+        # Lưu file với cấu trúc đúng - serialize to bytes first so the
+        # save is a single open/write/close instead of json.dump's
+        # incremental writes
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(test_data, f, indent=4)
+            if orjson is not None:
+                payload = orjson.dumps(test_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(test_data, indent=2).encode("utf-8")
+            Path(file_path).write_bytes(payload)
+            
+            # An in-place overwrite leaves the directory mtime untouched,
+            # so drop the cached listing and the file's timestamp entry
+            # or the refresh below would keep serving the stale row
+            self._dir_mtime_cache.pop(save_dir, None)
+            self._saved_tests_meta_cache.pop(file_path, None)
             
             self.logger.info(f"Generated test case saved to: {file_path}")
             
@@ -1090,20 +1474,18 @@ class MainWindow(LoggerMixin):
                         f"Test case saved to:\n{file_path}\n\n"
                         f"You can find it in the 'Saved Tests' tab.")
             
-            # Làm mới tab Saved Tests
+            # Làm mới tab Saved Tests - deferred so the messagebox close
+            # and tab switch paint before the refresh kicks off
             if hasattr(self, '_load_saved_tests'):
-                self._load_saved_tests()
+                self.root.after(0, self._load_saved_tests)
                 
             # Chuyển đến tab Saved Tests
-            if self.notebook:
-                for i in range(self.notebook.index("end")):
-                    if "Saved Tests" in self.notebook.tab(i, "text"):
-                        self.notebook.select(i)
-                        break
+            if self.notebook and "saved" in self._tab_index:
+                self.notebook.select(self._tab_index["saved"])
             
             # Cập nhật trạng thái
-            if self.status_var:
-                self.status_var.set(f"Test case {filename} created")
+            if self._set_status:
+                self._set_status(f"Test case {filename} created")
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create test case: {e}")
@@ -1115,16 +1497,17 @@ class MainWindow(LoggerMixin):
             messagebox.showinfo("Information", "Please select a test case first")
             return
         
-        # Get test case info
-        test_id = self.test_tree.item(selected[0], "values")[0]
-        test_name = self.test_tree.item(selected[0], "text").split(" ⚠️")[0]
-        category = self.test_tree.item(self.test_tree.parent(selected[0]), "text")
-        affects_network = self.test_tree.item(selected[0], "values")[2]
+        # Get test case info - fetch the values tuple once and reuse it
+        node = selected[0]
+        values = self.test_tree.item(node, "values")
+        test_id = values[0]
+        test_name = self.test_tree.item(node, "text").split(" ⚠️")[0]
+        category = self.test_tree.item(self.test_tree.parent(node), "text")
+        affects_network = values[2]
         
         # Extract service and action
-        parts = test_id.split('_')
-        service = parts[0]
-        action = parts[1] if len(parts) > 1 else "N/A"
+        service, _, action = test_id.partition('_')
+        action = action or "N/A"
         
         # Show different details based on test type
         if test_id == "wan_create":
@@ -1282,6 +1665,7 @@ class MainWindow(LoggerMixin):
             
         frame = ttk.Frame(self.notebook)
         self.notebook.add(frame, text="Test Queue")
+        self._tab_index["queue"] = self.notebook.index("end") - 1
         
         # Import the TestQueueManager
         from gui.widgets.queue_manager import TestQueueManager
@@ -1298,26 +1682,21 @@ class MainWindow(LoggerMixin):
         self.queue_status_var = tk.StringVar(value="Queue ready. No tests running.")
         ttk.Label(status_frame, textvariable=self.queue_status_var).pack(side=tk.LEFT)
         
-        # Display test count
-        count_label = ttk.Label(status_frame, text="0 tests in queue")
-        count_label.pack(side=tk.RIGHT)
-        
-        # Update the test count when queue changes
-        def update_count():
-            if hasattr(self, 'queue_manager'):
-                count = len(self.queue_manager.queue_items)
-                count_label.config(text=f"{count} tests in queue")
-        
-        # Schedule periodic updates
-        update_count()
-        if self.root:
-            self.root.after(1000, update_count)
+        # Display test count, refreshed by the queue manager's
+        # count-change callback whenever the queue actually changes -
+        # textvariable lets Tk repaint via the variable trace instead
+        # of a full widget reconfigure
+        self._queue_count_var = tk.StringVar(value="0 tests in queue")
+        ttk.Label(status_frame, textvariable=self._queue_count_var).pack(side=tk.RIGHT)
+        self.queue_manager.on_count_change = (
+            lambda n: self._queue_count_var.set(f"{n} tests in queue")
+        )
     
     def _on_queue_selection_change(self, item_data: dict) -> None:
         """Handle selection change in queue manager"""
         # Update UI based on selected item
-        if self.status_var:
-            self.status_var.set(f"Selected: {item_data.get('name', '')}")
+        if self._set_status:
+            self._set_status(f"Selected: {item_data.get('name', '')}")
         
         # Log the selection
         self.logger.debug(f"Queue item selected: {item_data.get('name', '')}")
@@ -1355,10 +1734,9 @@ class MainWindow(LoggerMixin):
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Add some sample log entries
-        self.log_text.insert(tk.END, "[2025-06-12 02:42:02] INFO - Application started\n")
-        self.log_text.insert(tk.END, "[2025-06-12 02:42:03] INFO - Configuration loaded\n")
-        self.log_text.insert(tk.END, "[2025-06-12 02:42:04] INFO - GUI initialized\n")
+        # Add the sample log entries with a single insert - each call
+        # into the Text widget triggers its own re-layout in Tk
+        self.log_text.insert(tk.END, "\n".join(_SAMPLE_LOG_LINES) + "\n")
         self.log_text.config(state=tk.DISABLED)
     
     def _create_status_bar(self) -> None:
@@ -1368,9 +1746,11 @@ class MainWindow(LoggerMixin):
             
         status_frame = ttk.Frame(self.root)
         status_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        self._status_frame = status_frame
         
         # Status message
         self.status_var = tk.StringVar(value="Ready")
+        self._set_status = self.status_var.set
         ttk.Label(status_frame, textvariable=self.status_var).pack(
             side=tk.LEFT, padx=10, pady=2
         )
@@ -1379,22 +1759,52 @@ class MainWindow(LoggerMixin):
         ttk.Label(status_frame, text=f"v{APP_VERSION}").pack(
             side=tk.RIGHT, padx=10, pady=2
         )
+
+    def _toast(self, message: str) -> None:
+        """Show a transient, self-dismissing note in the status bar"""
+        if not self._status_frame:
+            return
+        label = ttk.Label(self._status_frame, text=message, font="StatusFont")
+        label.pack(side=tk.LEFT, padx=10, pady=2)
+        self.root.after(1500, label.destroy)
     
     def _test_connection(self) -> None:
-        """Test SSH connection."""
-        # TODO: Implement in Phase 2
-        if self.connection_status_var:
-            self.connection_status_var.set("Testing connection...")
-        
-        if self.root:
-            self.root.after(2000, lambda: self._update_connection_status("Connection test not implemented"))
-        
+        """Test router connectivity without blocking the main loop."""
+        if self._set_connection_status:
+            self._set_connection_status("🟡 Testing connection...")
+
+        host = self.ssh_host_var.get() if self.ssh_host_var else self.config.network.ssh_host
+        try:
+            port = int(self.ssh_port_var.get()) if self.ssh_port_var else self.config.network.ssh_port
+        except ValueError:
+            self._update_connection_status("🔴 Invalid port number")
+            return
+
+        # Probe on the shared I/O pool (reusing its threads instead of
+        # spawning one per click) and marshal the status update back via
+        # root.after so the Tk event loop never blocks
+        def _worker():
+            result = self._run_connection_test(host, port)
+            if self.root:
+                self.root.after(0, self._update_connection_status, result)
+
+        self._io_pool.submit(_worker)
         self.logger.info("Connection test requested")
+
+    def _run_connection_test(self, host: str, port: int) -> str:
+        """Probe the router endpoint (blocking, worker thread only)."""
+        timeout = self.config.network.connection_timeout
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                pass
+            return f"🟢 Connected to {host}:{port}"
+        except OSError as e:
+            return f"🔴 Connection failed: {e}"
     
     def _update_connection_status(self, status: str) -> None:
         """Update connection status safely."""
-        if self.connection_status_var:
-            self.connection_status_var.set(status)
+        if self._set_connection_status:
+            self._set_connection_status(status)
     
     def _save_connection_settings(self) -> None:
         """Save connection settings."""
@@ -1409,8 +1819,8 @@ class MainWindow(LoggerMixin):
                 self.config.network.ssh_password = self.ssh_password_var.get()
             
             # TODO: Save to file in Phase 2
-            if self.status_var:
-                self.status_var.set("Connection settings saved")
+            if self._set_status:
+                self._set_status("Connection settings saved")
             self.logger.info("Connection settings updated")
             
         except ValueError as e:
@@ -1485,6 +1895,7 @@ generation and execution.
             
             # TODO: Save any unsaved data
             # TODO: Clean up resources
+            self._io_pool.shutdown(wait=False)
             
             if self.root:
                 self.root.destroy()
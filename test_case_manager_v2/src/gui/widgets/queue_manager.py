@@ -22,17 +22,21 @@ from datetime import datetime
 class TestQueueManager(ttk.Frame):
     """Widget for managing test queue with add, remove, reorder functionality"""
     
-    def __init__(self, parent, on_selection_change: Optional[Callable] = None, **kwargs):
+    def __init__(self, parent, on_selection_change: Optional[Callable] = None,
+                 on_count_change: Optional[Callable] = None, **kwargs):
         """
         Initialize the queue manager widget
         
         Args:
             parent: Parent widget
             on_selection_change: Callback function when selection changes
+            on_count_change: Callback invoked with the queue length
+                whenever items are added, removed, cleared, or loaded
             **kwargs: Additional arguments for ttk.Frame
         """
         super().__init__(parent, **kwargs)
         self.on_selection_change = on_selection_change
+        self.on_count_change = on_count_change
         self.queue_items: List[Dict] = []
         
         self._create_widgets()
@@ -139,6 +143,7 @@ class TestQueueManager(ttk.Frame):
                 "Queued"
             ))
             
+            self._notify_count_change()
             return True
         except Exception as e:
             print(f"Error adding item to queue: {e}")
@@ -151,7 +156,8 @@ class TestQueueManager(ttk.Frame):
             return
         
         # Get current item and index
-        curr_idx = self.queue_tree.index(selected[0])
+        item = selected[0]
+        curr_idx = self.queue_tree.index(item)
         if curr_idx == 0:  # Already at the top
             return
         
@@ -163,12 +169,13 @@ class TestQueueManager(ttk.Frame):
         self.queue_items[curr_idx]["order"] = curr_idx + 1
         self.queue_items[curr_idx-1]["order"] = curr_idx
         
-        # Refresh the TreeView to reflect the changes
-        self._refresh_queue_view()
-        
-        # Select the moved item
-        items = self.queue_tree.get_children()
-        self.queue_tree.selection_set(items[curr_idx-1])
+        # Move the row in place and renumber the two affected cells
+        # instead of rebuilding the whole TreeView; the moved row keeps
+        # its selection automatically
+        other = self.queue_tree.get_children()[curr_idx - 1]
+        self.queue_tree.move(item, "", curr_idx - 1)
+        self.queue_tree.set(item, "order", curr_idx)
+        self.queue_tree.set(other, "order", curr_idx + 1)
     
     def move_item_down(self):
         """Move the selected item down in the queue"""
@@ -177,7 +184,8 @@ class TestQueueManager(ttk.Frame):
             return
         
         # Get current item and index
-        curr_idx = self.queue_tree.index(selected[0])
+        item = selected[0]
+        curr_idx = self.queue_tree.index(item)
         if curr_idx >= len(self.queue_items) - 1:  # Already at the bottom
             return
         
@@ -189,12 +197,13 @@ class TestQueueManager(ttk.Frame):
         self.queue_items[curr_idx]["order"] = curr_idx + 1
         self.queue_items[curr_idx+1]["order"] = curr_idx + 2
         
-        # Refresh the TreeView to reflect the changes
-        self._refresh_queue_view()
-        
-        # Select the moved item
-        items = self.queue_tree.get_children()
-        self.queue_tree.selection_set(items[curr_idx+1])
+        # Move the row in place and renumber the two affected cells
+        # instead of rebuilding the whole TreeView; the moved row keeps
+        # its selection automatically
+        other = self.queue_tree.get_children()[curr_idx + 1]
+        self.queue_tree.move(item, "", curr_idx + 1)
+        self.queue_tree.set(item, "order", curr_idx + 2)
+        self.queue_tree.set(other, "order", curr_idx + 1)
     
     def remove_selected_item(self):
         """Remove the selected item from the queue"""
@@ -214,6 +223,7 @@ class TestQueueManager(ttk.Frame):
         
         # Refresh the TreeView
         self._refresh_queue_view()
+        self._notify_count_change()
     
     def clear_queue(self):
         """Clear the entire queue"""
@@ -224,6 +234,12 @@ class TestQueueManager(ttk.Frame):
         if messagebox.askyesno("Confirm", "Are you sure you want to clear the entire queue?"):
             self.queue_items = []
             self._refresh_queue_view()
+            self._notify_count_change()
+    
+    def _notify_count_change(self):
+        """Report the current queue length to the owner, if registered"""
+        if self.on_count_change:
+            self.on_count_change(len(self.queue_items))
     
     def _refresh_queue_view(self):
         """Refresh the TreeView to match the internal queue items"""
@@ -332,6 +348,7 @@ class TestQueueManager(ttk.Frame):
                     
                 # Refresh the view
                 self._refresh_queue_view()
+                self._notify_count_change()
                 
                 messagebox.showinfo("Success", f"Loaded {len(self.queue_items)} items from {file_path}")
             else: